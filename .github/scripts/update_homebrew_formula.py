@@ -19,6 +19,7 @@ SUPPORTED_TARGETS = (
     "x86_64-unknown-linux-gnu",
 )
 RELEASE_TAG_PATTERN = re.compile(r"^v[0-9]+(\.[0-9]+)*([-.].*)?$")
+SHA256_PATTERN = re.compile(r"[0-9a-fA-F]{64}")
 
 
 def asset_name(tag: str, target: str) -> str:
@@ -44,7 +45,7 @@ def load_checksums(tag: str, checksum_dir: Path) -> dict[str, str]:
             raise ValueError(
                 f"checksum file {checksum_file} names {filename!r}, expected {asset!r}"
             )
-        if not re.fullmatch(r"[0-9a-fA-F]{64}", checksum):
+        if not SHA256_PATTERN.fullmatch(checksum):
             raise ValueError(f"invalid sha256 in {checksum_file}: {checksum!r}")
         checksums[asset] = checksum.lower()
 